@@ -0,0 +1,192 @@
+import os
+import sys
+import random
+from itertools import accumulate, chain
+import matplotlib.pyplot as plt
+import numpy as np
+from tabulate import tabulate
+
+sys.path.append(
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "sort_classes")
+)
+from _sort_classes_ import SortingHandler, TimeMeasurer  # noqa: E402
+
+
+# Batch Sorting
+def _item_dtype(rows):
+    """Return the NumPy dtype that holds every item of ``rows`` unchanged.
+
+    Only rows made entirely of ints or entirely of floats qualify; bools,
+    mixed numbers and non-numeric items give None.
+    """
+    item_types = set(map(type, chain.from_iterable(rows)))
+    if item_types == {int}:
+        return np.int64
+    if item_types == {float}:
+        return np.float64
+    return None
+
+
+def sort_matrix(matrix):
+    """Sort every row of a 2-D array with a single vectorised call.
+
+    Args:
+        matrix: A 2-D array-like where each row is sorted independently.
+
+    Returns:
+        A new NumPy array with every row sorted in ascending order.
+
+    Raises:
+        ValueError: If the input is not two-dimensional.
+    """
+    matrix = np.asarray(matrix)
+    if matrix.ndim != 2:
+        raise ValueError(f"Expected a 2-D array of rows, got {matrix.ndim}-D")
+    return np.sort(matrix, axis=1, kind="stable")
+
+
+def sort_segments(rows):
+    """Sort a ragged list of lists with one lexsort over the concatenated rows.
+
+    All rows are packed into a single flat array together with a segment
+    key holding the row index. ``np.lexsort`` orders by segment first and by
+    value second, so every row ends up sorted in its own contiguous block.
+    Rows that mix ints and floats, hold bools, ints beyond 64 bits or
+    non-numeric items are sorted one by one with the built-in sort so that
+    item types are preserved.
+
+    Converting the lists to and from an array costs more than sorting short
+    rows, so this is slower than ``[sorted(row) for row in rows]``; it is
+    kept to measure the segmented approach.
+
+    Args:
+        rows: A list of lists of comparable items.
+
+    Returns:
+        A list of sorted lists, one per input row.
+    """
+    lengths = np.fromiter(map(len, rows), dtype=np.intp, count=len(rows))
+    dtype = _item_dtype(rows)
+    if dtype is None:
+        return [sorted(row) for row in rows]
+    try:
+        values = np.fromiter(
+            chain.from_iterable(rows), dtype=dtype, count=int(lengths.sum())
+        )
+    except OverflowError:
+        return [sorted(row) for row in rows]
+    segments = np.repeat(np.arange(len(rows)), lengths)
+    ordered = values[np.lexsort((values, segments))].tolist()
+    offsets = [0, *accumulate(lengths.tolist())]
+    return [ordered[start:stop] for start, stop in zip(offsets, offsets[1:])]
+
+
+def sort_batch(rows):
+    """Sort many short lists at once.
+
+    A 2-D NumPy array is sorted along its last axis with one vectorised
+    call and returned as an array. Lists of lists are sorted row by row with
+    the built-in sort: packing them into an array and back costs more than
+    the sorting itself, so the vectorised speedup only applies to data that
+    is already an ndarray.
+
+    Args:
+        rows: A list of lists, or a 2-D NumPy array.
+
+    Returns:
+        The sorted rows, in the same container type as the input.
+
+    Raises:
+        ValueError: If a NumPy array input is not two-dimensional.
+    """
+    if isinstance(rows, np.ndarray):
+        return sort_matrix(rows)
+    return [sorted(row) for row in rows]
+
+
+# Utility Functions
+def generate_random_batch(batch_count, size, ragged=False):
+    """Generate a list of lists of random integers.
+
+    When ``ragged`` is set, row lengths vary uniformly between 1 and ``size``.
+    """
+    rows = []
+    for _ in range(batch_count):
+        length = random.randint(1, size) if ragged else size
+        rows.append([random.randint(1, 1000) for _ in range(length)])
+    return rows
+
+
+def loop_sorting(sorting_handler, algorithm_name, rows):
+    """Sort every row by calling ``perform_sorting`` once per row."""
+    return [sorting_handler.perform_sorting(algorithm_name, row) for row in rows]
+
+
+def display_results(results, data_sizes):
+    """Display a table and a plot of the batch sorting comparison."""
+    headers = ["Row Size"] + list(results)
+    rows = [
+        [size] + [results[method][i] for method in results]
+        for i, size in enumerate(data_sizes)
+    ]
+    print(tabulate(rows, headers=headers, tablefmt="pipe"))
+    for method, times in results.items():
+        plt.plot(data_sizes, times, label=method)
+    plt.xlabel("Row Size")
+    plt.ylabel("Execution Time per Batch (seconds)")
+    plt.title("Batch Sorting vs. Per-Row perform_sorting")
+    plt.legend()
+    plt.show()
+
+
+# Main Function
+def main(
+    data_sizes, batch_count=1000, ragged=False, show_results=True, return_results=False
+):
+    """Compare batch sorting with looping over ``SortingHandler.perform_sorting``.
+
+    Args:
+        data_sizes: Row lengths to test.
+        batch_count: Number of rows sorted per batch.
+        ragged: Use rows of varying length instead of equal-length rows.
+        show_results: Display a table and a plot of the results.
+        return_results: Return the collected timings.
+    """
+    sorting_handler = SortingHandler()
+    methods = ["Batch Sort", "Batch Sort (ndarray)", "Segmented Sort"] + [
+        f"Loop {algorithm}" for algorithm in sorting_handler.algorithms
+    ]
+    results = {method: [] for method in methods}
+
+    for size in data_sizes:
+        rows = generate_random_batch(batch_count, size, ragged=ragged)
+        results["Batch Sort"].append(
+            TimeMeasurer.measure_time(sort_batch, rows, number=1)
+        )
+        # Rows already packed as a matrix skip the list-to-array conversion
+        matrix = np.asarray(rows) if not ragged else None
+        results["Batch Sort (ndarray)"].append(
+            TimeMeasurer.measure_time(sort_batch, matrix, number=1)
+            if matrix is not None
+            else float("nan")
+        )
+        results["Segmented Sort"].append(
+            TimeMeasurer.measure_time(sort_segments, rows, number=1)
+        )
+        for algorithm in sorting_handler.algorithms:
+            results[f"Loop {algorithm}"].append(
+                TimeMeasurer.measure_time(
+                    loop_sorting, sorting_handler, algorithm, rows, number=1
+                )
+            )
+
+    if show_results:
+        display_results(results, data_sizes)
+    if return_results:
+        return results
+
+
+# Execute if this is the main module
+if __name__ == "__main__":
+    data_sizes = [10, 20, 50, 100, 200]
+    main(data_sizes)
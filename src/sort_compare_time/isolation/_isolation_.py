@@ -0,0 +1,205 @@
+import gc
+import os
+import sys
+import timeit
+import multiprocessing
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+
+try:
+    import resource
+except ImportError:  # Not available on Windows
+    resource = None
+
+_BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+for _module_dir in ("sort_func", "sort_classes"):
+    sys.path.append(os.path.join(_BASE_DIR, "..", _module_dir))
+
+import _sort_func_  # noqa: E402
+import _sort_classes_  # noqa: E402
+
+IMPLEMENTATIONS = ("func", "class")
+RUSAGE_FIELDS = {
+    "Voluntary Context Switches": "ru_nvcsw",
+    "Involuntary Context Switches": "ru_nivcsw",
+    "Minor Page Faults": "ru_minflt",
+    "Major Page Faults": "ru_majflt",
+}
+
+
+def build_sort_call(implementation, algorithm, data):
+    """Return a zero-argument callable that copies and sorts the data.
+
+    Both implementations copy the input on every call (the class version
+    through perform_sorting), so func and class timings cover the same work.
+    """
+    if implementation == "func":
+        sort = _sort_func_.ALGORITHMS[algorithm]
+        return lambda: sort(data[:])
+    if implementation == "class":
+        sorting_handler = _sort_classes_.SortingHandler()
+        return lambda: sorting_handler.perform_sorting(algorithm, data)
+    raise ValueError(f"Implementation {implementation} not found")
+
+
+def rusage_snapshot():
+    """Return the current process' context-switch and page-fault counters."""
+    if resource is None:
+        return {}
+    usage = resource.getrusage(resource.RUSAGE_SELF)
+    return {name: getattr(usage, field) for name, field in RUSAGE_FIELDS.items()}
+
+
+def measure_cell(implementation, algorithm, size, number=10, warmup=3):
+    """Measure one (implementation, algorithm, size) cell.
+
+    The call is warmed up first, then timed with the garbage collector
+    disabled. Context switches and page faults are recorded around the
+    timed region only.
+
+    Returns:
+        A dict with the average time per call and the rusage deltas.
+    """
+    data = _sort_func_.generate_random_data(size)
+    sort_call = build_sort_call(implementation, algorithm, data)
+    timer = timeit.Timer(sort_call)
+    timer.timeit(warmup)
+
+    gc.collect()
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        usage_before = rusage_snapshot()
+        elapsed = timer.timeit(number)
+        usage_after = rusage_snapshot()
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+
+    record = {
+        "implementation": implementation,
+        "algorithm": algorithm,
+        "size": size,
+        "time": elapsed / number,
+    }
+    record.update(
+        {name: usage_after[name] - usage_before[name] for name in usage_after}
+    )
+    return record
+
+
+def measure_in_fresh_interpreter(*args):
+    """Run measure_cell in a newly spawned worker process and return its record.
+
+    A single-use executor gives every cell its own interpreter on any
+    Python version (max_tasks_per_child needs 3.11).
+    """
+    with ProcessPoolExecutor(
+        max_workers=1, mp_context=multiprocessing.get_context("spawn")
+    ) as executor:
+        return executor.submit(measure_cell, *args).result()
+
+
+def cell_order(algorithms, size, rounds=3, interleaved=False):
+    """List the cells to run for one size, in execution order.
+
+    Sequential order runs every round of the func implementation before the
+    class one (AAA BBB); interleaved order alternates them (ABAB) so both
+    see the same machine state.
+    """
+    if interleaved:
+        return [
+            (implementation, algorithm, size)
+            for algorithm in algorithms
+            for _ in range(rounds)
+            for implementation in IMPLEMENTATIONS
+        ]
+    return [
+        (implementation, algorithm, size)
+        for algorithm in algorithms
+        for implementation in IMPLEMENTATIONS
+        for _ in range(rounds)
+    ]
+
+
+def iter_cells(
+    data_sizes,
+    isolated=True,
+    interleaved=False,
+    rounds=3,
+    number=10,
+    warmup=3,
+    skip=None,
+):
+    """Measure the func and class implementations cell by cell.
+
+    With ``isolated`` set, every cell runs in a freshly spawned interpreter
+    so heap growth and GC state never carry over between measurements.
+
+    Args:
+        skip: Optional Counter of (implementation, algorithm, size) cells
+            that were already measured; that many occurrences of each cell
+            are skipped, which lets an interrupted sweep resume.
+
+    Yields:
+        One record per cell as soon as the cell has been measured.
+    """
+    algorithms = list(_sort_func_.ALGORITHMS)
+    skip = Counter(skip or {})
+
+    for size in data_sizes:
+        for cell in cell_order(algorithms, size, rounds, interleaved):
+            if skip[cell] > 0:
+                skip[cell] -= 1
+                continue
+            args = cell + (number, warmup)
+            if isolated:
+                yield measure_in_fresh_interpreter(*args)
+            else:
+                yield measure_cell(*args)
+
+
+def summarize_records(records, data_sizes):
+    """Fold per-cell records into result tables.
+
+    Returns:
+        (results, noise): results maps implementation to algorithm to a list
+        of per-size times (the minimum across rounds), shaped like the output
+        of ``_sort_func_.main`` and ``MainProgram.run``; noise is a list of
+        per-cell records with the summed rusage counters.
+    """
+    algorithms = list(_sort_func_.ALGORITHMS)
+    results = {
+        implementation: {algorithm: [] for algorithm in algorithms}
+        for implementation in IMPLEMENTATIONS
+    }
+    noise = []
+    for size in data_sizes:
+        for implementation in IMPLEMENTATIONS:
+            for algorithm in algorithms:
+                cell_records = [
+                    record
+                    for record in records
+                    if record["implementation"] == implementation
+                    and record["algorithm"] == algorithm
+                    and record["size"] == size
+                ]
+                results[implementation][algorithm].append(
+                    min(record["time"] for record in cell_records)
+                )
+                summary = {
+                    "implementation": implementation,
+                    "algorithm": algorithm,
+                    "size": size,
+                }
+                for name in RUSAGE_FIELDS:
+                    if name in cell_records[0]:
+                        summary[name] = sum(record[name] for record in cell_records)
+                noise.append(summary)
+
+    return results, noise
+
+
+def run_cells(data_sizes, **options):
+    """Measure every cell and return ``summarize_records`` output."""
+    return summarize_records(list(iter_cells(data_sizes, **options)), data_sizes)
@@ -1,6 +1,6 @@
 from tabulate import tabulate
-import matplotlib.pyplot as plt
 import sys
+import argparse
 import importlib.util
 import numpy as np
 
@@ -62,6 +62,9 @@ def plot_results(data_sizes, sort_func_results, sort_classes_results, algorithms
     - sort_classes_results: Execution times of the class-based implementations.
     - algorithms: List of algorithm names.
     """
+    # Imported lazily so spawned measurement workers skip loading pyplot
+    import matplotlib.pyplot as plt
+
     for alg in algorithms:
         plt.figure(figsize=(10, 6))
         plt.plot(data_sizes, sort_func_results[alg], label="Functional Implementation")
@@ -75,22 +78,83 @@ def plot_results(data_sizes, sort_func_results, sort_classes_results, algorithms
         plt.show()
 
 
-def main(data_sizes):
+def display_noise(noise):
+    """
+    Prints the context switches and page faults recorded for every measured cell.
+
+    Parameters:
+    - noise: Per-cell records returned by the isolation module.
+    """
+    if not noise or len(noise[0]) <= 3:
+        return
+    headers = list(noise[0])
+    rows = [[record[header] for header in headers] for record in noise]
+    print("\nMeasurement Noise (summed over rounds):")
+    print(tabulate(rows, headers=headers, tablefmt="pipe"))
+
+
+def main(
+    data_sizes,
+    isolated=False,
+    interleaved=False,
+    checkpoint_path=None,
+    cache_path=None,
+):
     """
     Main program to compare the performance and complexity of sorting algorithms implemented as functions and classes.
 
     Parameters:
     - data_sizes: A list of data sizes to test the algorithms with.
+    - isolated: Measure every cell in a fresh worker interpreter with GC disabled.
+    - interleaved: Alternate func and class runs (ABAB) instead of AAAA BBBB.
+    - checkpoint_path: JSON-lines file that streamed measurements are saved to;
+      an interrupted run with the same sizes and options resumes from it.
+    - cache_path: JSON-lines measurement cache; only cells whose algorithm source,
+      size, data distribution, Python version or machine changed are re-measured.
     """
-    # Load sorting function and classes from external modules
-    sort_func = load_module("src/sort_compare_time/sort_func", "_sort_func_").main
-    SortClasses = load_module(
-        "src/sort_compare_time/sort_classes", "_sort_classes_"
-    ).MainProgram(data_sizes)
+    if isolated or interleaved or checkpoint_path or cache_path:
+        summarize_records = load_module(
+            "src/sort_compare_time/isolation", "_isolation_"
+        ).summarize_records
+        stream_measurements = load_module(
+            "src/sort_compare_time/streaming", "_streaming_"
+        ).stream_measurements
+        cache = None
+        if cache_path:
+            MeasurementCache = load_module(
+                "src/sort_compare_time/measurement_cache", "_measurement_cache_"
+            ).MeasurementCache
+            cache = MeasurementCache(cache_path)
+        records = list(
+            stream_measurements(
+                data_sizes,
+                checkpoint_path=checkpoint_path,
+                cache=cache,
+                harness="cell" if isolated or interleaved else "legacy",
+                isolated=isolated,
+                interleaved=interleaved,
+            )
+        )
+        results, noise = summarize_records(records, data_sizes)
+        if cache:
+            print(
+                f"Measurement cache: {cache.hits} cells reused, "
+                f"{cache.misses} cells measured"
+            )
+        sort_func_results, sort_classes_results = results["func"], results["class"]
+        display_noise(noise)
+    else:
+        # Load sorting function and classes from external modules
+        sort_func = load_module("src/sort_compare_time/sort_func", "_sort_func_").main
+        SortClasses = load_module(
+            "src/sort_compare_time/sort_classes", "_sort_classes_"
+        ).MainProgram(data_sizes)
 
-    # Execute sorting and collect results
-    sort_func_results = sort_func(data_sizes, show_results=False, return_results=True)
-    sort_classes_results = SortClasses.run(show_results=False, return_results=True)
+        # Execute sorting and collect results
+        sort_func_results = sort_func(
+            data_sizes, show_results=False, return_results=True
+        )
+        sort_classes_results = SortClasses.run(show_results=False, return_results=True)
 
     # Define the algorithms to compare
     algorithms = ["Merge Sort", "Insertion Sort", "TimSort"]
@@ -159,7 +223,158 @@ def main(data_sizes):
     plot_results(data_sizes, sort_func_results, sort_classes_results, algorithms)
 
 
+def run_batch_sort(data_sizes):
+    """
+    Compares batch sorting of many short lists with looping over perform_sorting.
+
+    Parameters:
+    - data_sizes: A list of row lengths to test.
+    """
+    batch_sort = load_module("src/sort_compare_time/batch_sort", "_batch_sort_").main
+    batch_sort(data_sizes)
+
+
+def run_sorted_container(data_sizes):
+    """
+    Compares a sorted container with re-sorting the whole list after every batch of inserts.
+
+    Parameters:
+    - data_sizes: A list of total insert counts to test.
+    """
+    SortedContainer = load_module(
+        "src/sort_compare_time/sorted_container", "_sorted_container_"
+    ).MainProgram(data_sizes)
+    SortedContainer.run()
+
+
+def run_selection(data_sizes):
+    """
+    Compares partial sort / selection backends with full TimSort and merge sort.
+
+    Parameters:
+    - data_sizes: A list of data sizes to test the algorithms with.
+    """
+    selection = load_module(
+        "src/sort_compare_time/sort_func", "_sort_func_"
+    ).selection_main
+    selection(data_sizes, k_values=(1, 10, 100))
+
+
+def run_key_sorting(data_sizes):
+    """
+    Compares key-function sorting of dict records across algorithms and NumPy argsort.
+
+    Parameters:
+    - data_sizes: A list of record counts to test the algorithms with.
+    """
+    key_sorting = load_module("src/sort_compare_time/sort_func", "_sort_func_").key_main
+    key_sorting(data_sizes)
+
+
+def run_typed_buffers(data_sizes):
+    """
+    Compares list inputs with array.array and memoryview inputs in time and memory.
+
+    Parameters:
+    - data_sizes: A list of data sizes; only the largest one is measured.
+    """
+    typed_buffers = load_module(
+        "src/sort_compare_time/sort_func", "_sort_func_"
+    ).typed_main
+    typed_buffers([max(data_sizes)])
+
+
+def run_threaded(data_sizes):
+    """
+    Measures thread-pool throughput and parallel merge sort scaling per thread count.
+
+    Parameters:
+    - data_sizes: A list of data sizes to test the algorithms with.
+    """
+    Threaded = load_module("src/sort_compare_time/threaded", "_threaded_").MainProgram(
+        data_sizes
+    )
+    Threaded.run()
+
+
+def run_memoization(data_sizes):
+    """
+    Replays sort workloads with repeated payloads with and without result memoization.
+
+    Parameters:
+    - data_sizes: A list of payload sizes to test the algorithms with.
+    """
+    Memoization = load_module(
+        "src/sort_compare_time/memoization", "_memoization_"
+    ).MainProgram(data_sizes, repeat_ratios=(0.0, 0.25, 0.5, 0.75, 0.9))
+    Memoization.run()
+
+
+MODES = {
+    "compare": main,
+    "batch": run_batch_sort,
+    "incremental": run_sorted_container,
+    "selection": run_selection,
+    "key": run_key_sorting,
+    "typed": run_typed_buffers,
+    "threads": run_threaded,
+    "memo": run_memoization,
+}
+
+
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Sorting algorithm benchmarks.")
+    parser.add_argument("--mode", choices=MODES, default="compare")
+    parser.add_argument(
+        "--isolated",
+        action="store_true",
+        help="compare mode: run every measurement in a fresh worker interpreter",
+    )
+    parser.add_argument(
+        "--interleaved",
+        action="store_true",
+        help="compare mode: alternate func and class runs (ABAB)",
+    )
+    parser.add_argument(
+        "--checkpoint",
+        metavar="PATH",
+        help=(
+            "compare mode: stream measurements to PATH and resume from it; "
+            "timings are taken as in a plain run unless --isolated or "
+            "--interleaved switches to the per-cell harness"
+        ),
+    )
+    parser.add_argument(
+        "--cache",
+        metavar="PATH",
+        help="compare mode: reuse measurements of unchanged algorithms from PATH",
+    )
+    args = parser.parse_args()
+
     # data_sizes = [100, 500, 1000, 1500, 2000, 2500, 3000, 3500, 4000, 5000]
     data_sizes = [10, 20, 50, 100, 200, 400, 800, 1600, 3200, 6400, 12800]
-    main(data_sizes)
+    if args.mode == "batch":
+        # Batch sorting targets the short-list end of the size range
+        data_sizes = [size for size in data_sizes if size <= 200]
+    elif args.mode == "key":
+        # Insertion sort over records is quadratic, so cap the size range
+        data_sizes = [size for size in data_sizes if size <= 3200]
+    elif args.mode == "threads":
+        # Every thread count sorts a batch of jobs, including insertion sort
+        data_sizes = [size for size in data_sizes if 100 <= size <= 1600]
+    elif args.mode == "memo":
+        # Every request of the replayed workload runs each algorithm once
+        data_sizes = [size for size in data_sizes if 100 <= size <= 1600]
+    elif args.mode == "incremental":
+        # Re-sorting after every batch is quadratic in the number of batches
+        data_sizes = [size for size in data_sizes if 100 <= size <= 3200]
+    if args.mode == "compare":
+        main(
+            data_sizes,
+            isolated=args.isolated,
+            interleaved=args.interleaved,
+            checkpoint_path=args.checkpoint,
+            cache_path=args.cache,
+        )
+    else:
+        MODES[args.mode](data_sizes)
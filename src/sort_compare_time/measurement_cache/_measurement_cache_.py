@@ -0,0 +1,167 @@
+import os
+import sys
+import json
+import types
+import hashlib
+import inspect
+import platform
+
+sys.path.append(
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "isolation")
+)
+import _isolation_  # noqa: E402
+import _sort_func_  # noqa: E402
+import _sort_classes_  # noqa: E402
+
+
+def _referenced_names(obj):
+    """Yield every global name used by a function or by a class' methods."""
+    if inspect.isclass(obj):
+        for member in vars(obj).values():
+            if isinstance(member, (staticmethod, classmethod)):
+                member = member.__func__
+            if inspect.isfunction(member):
+                yield from _referenced_names(member)
+        return
+    codes = [obj.__code__]
+    while codes:
+        code = codes.pop()
+        yield from code.co_names
+        codes.extend(c for c in code.co_consts if isinstance(c, types.CodeType))
+
+
+def source_closure(*objects):
+    """Collect the given objects plus the same-module functions and classes
+    they reference, directly or indirectly, including base classes.
+
+    Returns:
+        The objects sorted by qualified name.
+    """
+    seen = {}
+    pending = list(objects)
+    while pending:
+        obj = pending.pop()
+        name = f"{obj.__module__}.{obj.__qualname__}"
+        if name in seen:
+            continue
+        seen[name] = obj
+        module_globals = vars(sys.modules[obj.__module__])
+        if inspect.isclass(obj):
+            pending.extend(
+                base for base in obj.__bases__ if base.__module__ == obj.__module__
+            )
+        for referenced in _referenced_names(obj):
+            candidate = module_globals.get(referenced)
+            if (
+                inspect.isfunction(candidate) or inspect.isclass(candidate)
+            ) and candidate.__module__ == obj.__module__:
+                pending.append(candidate)
+    return [seen[name] for name in sorted(seen)]
+
+
+def source_hash(*objects):
+    """SHA-256 of the source of the objects and everything they reference."""
+    digest = hashlib.sha256()
+    for obj in source_closure(*objects):
+        digest.update(inspect.getsource(obj).encode("utf-8"))
+    return digest.hexdigest()
+
+
+def algorithm_objects(implementation, algorithm):
+    """Return the function or class whose source defines a measured cell."""
+    if implementation == "func":
+        return (_sort_func_.ALGORITHMS[algorithm],)
+    # perform_sorting rather than the whole SortingHandler, whose __init__
+    # references every algorithm class
+    sorting_handler = _sort_classes_.SortingHandler()
+    return (
+        type(sorting_handler.algorithms[algorithm]),
+        _sort_classes_.SortingHandler.perform_sorting,
+    )
+
+
+def machine_fingerprint():
+    """Describe the interpreter and hardware the measurements were taken on."""
+    return {
+        "python": f"{platform.python_implementation()} {platform.python_version()}",
+        "gil_enabled": getattr(sys, "_is_gil_enabled", lambda: True)(),
+        "machine": platform.machine(),
+        "processor": platform.processor(),
+        "system": platform.system(),
+        "node": platform.node(),
+        "cpu_count": os.cpu_count(),
+    }
+
+
+class MeasurementCache:
+    """Append-only JSON-lines store of cell records keyed by what produced them.
+
+    A cell's key hashes the source of the algorithm (and of everything it
+    calls), the data size, the data distribution (the source of the data
+    generator), the measurement harnesses, the measurement options the
+    caller passes in, the Python version and a machine fingerprint. Editing
+    one algorithm therefore only invalidates that algorithm's cells.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.hits = 0
+        self.misses = 0
+        self._fingerprint = machine_fingerprint()
+        self._distribution = source_hash(_sort_func_.generate_random_data)
+        self._harness = source_hash(
+            _isolation_.measure_cell,
+            _sort_func_.iter_results,
+            _sort_classes_.MainProgram.iter_run,
+        )
+        self._sources = {}
+        self._records = {}
+        if os.path.exists(path):
+            with open(path, encoding="utf-8") as cache_file:
+                for line in cache_file:
+                    try:
+                        entry = json.loads(line)
+                    except json.JSONDecodeError:
+                        continue
+                    self._records.setdefault(entry["key"], []).append(entry["record"])
+
+    def cell_key(self, implementation, algorithm, size, options):
+        """Return the cache key of one (implementation, algorithm, size) cell.
+
+        ``options`` is a JSON-serializable dict of everything else that
+        affects how the cell was measured.
+        """
+        source = self._sources.get((implementation, algorithm))
+        if source is None:
+            source = source_hash(*algorithm_objects(implementation, algorithm))
+            self._sources[(implementation, algorithm)] = source
+        key_fields = {
+            "implementation": implementation,
+            "algorithm": algorithm,
+            "source": source,
+            "size": size,
+            "distribution": self._distribution,
+            "harness": self._harness,
+            "options": options,
+            "machine": self._fingerprint,
+        }
+        encoded = json.dumps(key_fields, sort_keys=True).encode("utf-8")
+        return hashlib.sha256(encoded).hexdigest()
+
+    def lookup(self, implementation, algorithm, size, rounds, options):
+        """Return up to ``rounds`` cached records for a cell."""
+        key = self.cell_key(implementation, algorithm, size, options)
+        records = self._records.get(key, [])
+        records = records[:rounds]
+        self.hits += len(records)
+        self.misses += rounds - len(records)
+        return records
+
+    def add(self, record, options):
+        """Store a freshly measured record and append it to the cache file."""
+        key = self.cell_key(
+            record["implementation"], record["algorithm"], record["size"], options
+        )
+        self._records.setdefault(key, []).append(record)
+        with open(self.path, "a", encoding="utf-8") as cache_file:
+            cache_file.write(json.dumps({"key": key, "record": record}) + "\n")
@@ -0,0 +1,264 @@
+import os
+import sys
+import pickle
+import random
+import hashlib
+import timeit
+from collections import OrderedDict
+import matplotlib.pyplot as plt
+from tabulate import tabulate
+
+sys.path.append(
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "sort_classes")
+)
+from _sort_classes_ import (  # noqa: E402
+    SortingHandler,
+    copy_slice,
+    generate_random_data,
+    is_typed_buffer,
+)
+
+IMMUTABLE_ITEM_TYPES = frozenset({int, float, bool, str, bytes})
+
+
+def is_memoizable(data):
+    """Return True if sorted copies of data cannot share mutable items.
+
+    Typed buffers hold raw values; lists qualify when every item is an int,
+    float, bool, str or bytes.
+    """
+    if is_typed_buffer(data):
+        return True
+    return isinstance(data, list) and set(map(type, data)) <= IMMUTABLE_ITEM_TYPES
+
+
+def content_hash(data):
+    """Return a 128-bit BLAKE2b digest of the data's type and contents.
+
+    Typed buffers are hashed straight from their memory; other sequences
+    are pickled first (for lists of ints this is faster than packing them
+    into an array).
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    if is_typed_buffer(data):
+        typecode = data.format if isinstance(data, memoryview) else data.typecode
+        digest.update(f"buffer:{typecode}:".encode())
+        digest.update(data)
+    else:
+        digest.update(f"{type(data).__qualname__}:".encode())
+        digest.update(pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL))
+    return digest.digest()
+
+
+def result_nbytes(data):
+    """Approximate memory held by a sorted result, including boxed items.
+
+    str and bytes items are measured one by one. A number's size grows with
+    its magnitude, which peaks at one end of a sorted result, so every
+    number is counted at the size of the larger end.
+    """
+    if is_typed_buffer(data) or not data:
+        return sys.getsizeof(data)
+    if isinstance(data[0], (str, bytes)):
+        return sys.getsizeof(data) + sum(map(sys.getsizeof, data))
+    item_bytes = max(sys.getsizeof(data[0]), sys.getsizeof(data[-1]))
+    return sys.getsizeof(data) + len(data) * item_bytes
+
+
+class MemoizingSortingHandler:
+    """Wraps a SortingHandler and memoizes perform_sorting results.
+
+    Results are keyed on the algorithm name, the reverse flag and a content
+    hash of the input, and kept in an LRU bounded by their total size in
+    bytes. Calls with a key function, which cannot be hashed by content,
+    and inputs with items other than those in IMMUTABLE_ITEM_TYPES, which
+    a caller could mutate inside a cached result, bypass the cache.
+    """
+
+    def __init__(self, sorting_handler=None, max_bytes=64 * 1024 * 1024):
+        self.sorting_handler = sorting_handler or SortingHandler()
+        self.algorithms = self.sorting_handler.algorithms
+        self.max_bytes = max_bytes
+        self.current_bytes = 0
+        self._cache = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.bypasses = 0
+        self.evictions = 0
+        self.bytes_saved = 0
+
+    def perform_sorting(self, algorithm_name, data, key=None, reverse=False):
+        """Perform sorting, serving repeated inputs from the cache.
+
+        Returns a fresh copy on every call, so callers may modify it.
+        """
+        if key is not None or not is_memoizable(data):
+            self.bypasses += 1
+            return self.sorting_handler.perform_sorting(
+                algorithm_name, data, key=key, reverse=reverse
+            )
+
+        cache_key = (algorithm_name, reverse, content_hash(data))
+        entry = self._cache.get(cache_key)
+        if entry is not None:
+            self._cache.move_to_end(cache_key)
+            result, nbytes = entry
+            self.hits += 1
+            self.bytes_saved += nbytes
+            return copy_slice(result)
+
+        self.misses += 1
+        result = self.sorting_handler.perform_sorting(
+            algorithm_name, data, reverse=reverse
+        )
+        self._store(cache_key, copy_slice(result))
+        return result
+
+    def _store(self, cache_key, result):
+        """Insert a result and evict least recently used ones over the budget."""
+        nbytes = result_nbytes(result)
+        if nbytes > self.max_bytes:
+            return
+        self._cache[cache_key] = (result, nbytes)
+        self.current_bytes += nbytes
+        while self.current_bytes > self.max_bytes:
+            _, (_, evicted_bytes) = self._cache.popitem(last=False)
+            self.current_bytes -= evicted_bytes
+            self.evictions += 1
+
+    def clear(self):
+        """Drop every cached result; statistics are kept."""
+        self._cache.clear()
+        self.current_bytes = 0
+
+    def stats(self):
+        """Return hit/miss counters and byte usage."""
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "bypasses": self.bypasses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "evictions": self.evictions,
+            "entries": len(self._cache),
+            "cached_bytes": self.current_bytes,
+            "bytes_saved": self.bytes_saved,
+        }
+
+
+# Utility functions
+def generate_workload(size, requests, repeat_ratio, pool_size=16):
+    """Generate sort requests where ``repeat_ratio`` of them repeat earlier payloads.
+
+    Repeats are fresh copies, so equal content never shares identity.
+    """
+    seen = []
+    workload = []
+    for _ in range(requests):
+        if seen and random.random() < repeat_ratio:
+            workload.append(random.choice(seen)[:])
+        else:
+            payload = generate_random_data(size)
+            workload.append(payload)
+            seen.append(payload)
+            if len(seen) > pool_size:
+                seen.pop(0)
+    return workload
+
+
+def replay(sorting_handler, algorithm_name, workload):
+    """Send every request of a workload through perform_sorting."""
+    for payload in workload:
+        sorting_handler.perform_sorting(algorithm_name, payload)
+
+
+class ResultHandler:
+    """Handles displaying and plotting of the memoization replay results."""
+
+    @staticmethod
+    def display_table(rows):
+        """Display results in a table format."""
+        headers = [
+            "Data Size",
+            "Repeat Ratio",
+            "Algorithm",
+            "Plain Time (s)",
+            "Memoized Time (s)",
+            "Speedup",
+            "Hits",
+            "Misses",
+            "Bytes Saved",
+        ]
+        print(tabulate(rows, headers=headers, tablefmt="pipe"))
+
+    @staticmethod
+    def plot_results(rows):
+        """Plots the memoization speedup against the repeat ratio."""
+        series = {}
+        for size, ratio, algorithm, _, _, speedup, *_ in rows:
+            label = f"{algorithm} (n={size})"
+            series.setdefault(label, ([], []))
+            series[label][0].append(ratio)
+            series[label][1].append(speedup)
+        for label, (ratios, speedups) in series.items():
+            plt.plot(ratios, speedups, marker="o", label=label)
+        plt.xlabel("Repeat Ratio")
+        plt.ylabel("Speedup vs. perform_sorting")
+        plt.title("Memoized Sorting Workload Replay")
+        plt.legend()
+        plt.show()
+
+
+class MainProgram:
+    """Replays sort workloads with and without the memoizing wrapper."""
+
+    def __init__(self, data_sizes, repeat_ratios=(0.0, 0.5, 0.9), requests=200):
+        self.data_sizes = data_sizes
+        self.repeat_ratios = repeat_ratios
+        self.requests = requests
+        self.sorting_handler = SortingHandler()
+
+    def run(self, show_results=True, return_results=False):
+        """Executes the workload replay for every size and repeat ratio."""
+        rows = []
+        for size in self.data_sizes:
+            for ratio in self.repeat_ratios:
+                workload = generate_workload(size, self.requests, ratio)
+                for algorithm in self.sorting_handler.algorithms:
+                    start = timeit.default_timer()
+                    replay(self.sorting_handler, algorithm, workload)
+                    plain_time = timeit.default_timer() - start
+
+                    memoizing_handler = MemoizingSortingHandler(self.sorting_handler)
+                    start = timeit.default_timer()
+                    replay(memoizing_handler, algorithm, workload)
+                    memoized_time = timeit.default_timer() - start
+
+                    stats = memoizing_handler.stats()
+                    rows.append(
+                        [
+                            size,
+                            ratio,
+                            algorithm,
+                            plain_time,
+                            memoized_time,
+                            plain_time / memoized_time,
+                            stats["hits"],
+                            stats["misses"],
+                            stats["bytes_saved"],
+                        ]
+                    )
+
+        if show_results:
+            ResultHandler.display_table(rows)
+            ResultHandler.plot_results(rows)
+
+        if return_results:
+            return rows
+
+
+# Main execution block
+if __name__ == "__main__":
+    data_sizes = [100, 1000, 3000]
+    program = MainProgram(data_sizes)
+    program.run()
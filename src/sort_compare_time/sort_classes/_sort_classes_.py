@@ -1,5 +1,6 @@
+import array
 import random
-import matplotlib.pyplot as plt
+import numpy as np
 from tabulate import tabulate
 import timeit
 
@@ -10,6 +11,28 @@ def generate_random_data(size):
     return [random.randint(1, 1000) for _ in range(size)]
 
 
+# Utility functions for array.array and memoryview inputs
+def is_typed_buffer(data):
+    """Return True for array.array and memoryview inputs."""
+    return isinstance(data, (array.array, memoryview))
+
+
+def copy_slice(data, start=0, stop=None):
+    """Copy data[start:stop], turning memoryview slices into compact arrays."""
+    if isinstance(data, memoryview):
+        return array.array(data.format, data[start:stop].tobytes())
+    return data[start:stop]
+
+
+def assign_all(data, values):
+    """Overwrite every item of data in place with values."""
+    if is_typed_buffer(data):
+        typecode = data.format if isinstance(data, memoryview) else data.typecode
+        data[:] = array.array(typecode, values)
+    else:
+        data[:] = values
+
+
 class TimeMeasurer:
     """Static class for measuring execution time of sorting algorithms."""
 
@@ -35,18 +58,37 @@ class TimeMeasurer:
 class SortingAlgorithm:
     """Abstract base class for sorting algorithms."""
 
-    def sort(self, data):
+    def sort(self, data, key=None, reverse=False):
         """Sort the data. Must be implemented by subclasses."""
         raise NotImplementedError("Sort function not defined")
 
+    def _keyed_sort(self, data, key, reverse):
+        """Sort by key, computing each key once (decorate-sort-undecorate).
+
+        Keys are paired with their positions so ties never compare the
+        records themselves and the result is stable; a descending sort
+        reverses the input before and the output after sorting.
+        """
+        records = copy_slice(data)
+        if reverse:
+            records.reverse()
+        keys = records if key is None else map(key, records)
+        decorated = list(zip(keys, range(len(records))))
+        self.sort(decorated)
+        if reverse:
+            decorated.reverse()
+        assign_all(data, [records[i] for _, i in decorated])
+
 
 class MergeSort(SortingAlgorithm):
     """Implements the merge sort algorithm."""
 
-    def sort(self, data):
-        if len(data) > 1:
+    def sort(self, data, key=None, reverse=False):
+        if key is not None or reverse:
+            self._keyed_sort(data, key, reverse)
+        elif len(data) > 1:
             mid = len(data) // 2
-            left, right = data[:mid], data[mid:]
+            left, right = copy_slice(data, 0, mid), copy_slice(data, mid)
             self.sort(left)
             self.sort(right)
             self._merge(data, left, right)
@@ -72,23 +114,31 @@ class MergeSort(SortingAlgorithm):
 class InsertionSort(SortingAlgorithm):
     """Implements the insertion sort algorithm."""
 
-    def sort(self, arr):
+    def sort(self, arr, key=None, reverse=False):
         """Simple insertion sort algorithm."""
+        if key is not None or reverse:
+            self._keyed_sort(arr, key, reverse)
+            return
         for i in range(1, len(arr)):
-            key = arr[i]
+            current = arr[i]
             j = i - 1
-            while j >= 0 and key < arr[j]:
+            while j >= 0 and current < arr[j]:
                 arr[j + 1] = arr[j]
                 j -= 1
-            arr[j + 1] = key
+            arr[j + 1] = current
 
 
 class TimSort(SortingAlgorithm):
     """Wrapper for Python's built-in sort method, utilizing TimSort."""
 
-    def sort(self, arr):
-        """Python's built-in sort."""
-        arr.sort()
+    def sort(self, arr, key=None, reverse=False):
+        """Python's built-in sort; typed buffers use NumPy's stable sort in place."""
+        if not is_typed_buffer(arr):
+            arr.sort(key=key, reverse=reverse)
+        elif key is not None or reverse:
+            self._keyed_sort(arr, key, reverse)
+        else:
+            np.asarray(arr).sort(kind="stable")
 
 
 class SortingHandler:
@@ -101,14 +151,18 @@ class SortingHandler:
             "TimSort": TimSort(),
         }
 
-    def perform_sorting(self, algorithm_name, data):
-        """Perform sorting using the specified algorithm."""
+    def perform_sorting(self, algorithm_name, data, key=None, reverse=False):
+        """Perform sorting using the specified algorithm.
+
+        Lists and array.array inputs return a sorted copy of the same type;
+        a memoryview input returns a sorted array.array copy of its buffer.
+        """
         algorithm = self.algorithms.get(algorithm_name)
         if not algorithm:
             raise ValueError(f"Algorithm {algorithm_name} not found")
         # Clone data to prevent in-place sorting affecting subsequent algorithms
-        data_copy = data[:]
-        algorithm.sort(data_copy)
+        data_copy = copy_slice(data)
+        algorithm.sort(data_copy, key=key, reverse=reverse)
         return data_copy
 
 
@@ -128,6 +182,9 @@ class ResultHandler:
     @staticmethod
     def plot_results(data_sizes, results):
         """Plots the sorting performance results."""
+        # Imported lazily so spawned measurement workers skip loading pyplot
+        import matplotlib.pyplot as plt
+
         for algorithm, execution_times in results.items():
             plt.plot(data_sizes, execution_times, label=algorithm)
         plt.xlabel("Data Size")
@@ -145,15 +202,25 @@ class MainProgram:
         self.sorting_handler = SortingHandler()
         self.results = {algorithm: [] for algorithm in self.sorting_handler.algorithms}
 
-    def run(self, show_results=True, return_results=False):
-        """Executes the performance comparison for the specified data sizes."""
+    def iter_run(self, skip=()):
+        """Yield (algorithm, size, time) as soon as each measurement finishes.
+
+        Measurements whose (algorithm, size) pair is in ``skip`` are not run.
+        """
         for size in self.data_sizes:
             data = generate_random_data(size)
             for algorithm in self.sorting_handler.algorithms:
+                if (algorithm, size) in skip:
+                    continue
                 execution_time = TimeMeasurer.measure_time(
                     self.sorting_handler.perform_sorting, algorithm, data
                 )
-                self.results[algorithm].append(execution_time)
+                yield algorithm, size, execution_time
+
+    def run(self, show_results=True, return_results=False):
+        """Executes the performance comparison for the specified data sizes."""
+        for algorithm, _, execution_time in self.iter_run():
+            self.results[algorithm].append(execution_time)
 
         if show_results:
             ResultHandler.display_table(self.data_sizes, self.results)
@@ -1,15 +1,69 @@
+import sys
 import timeit
+import array
+import heapq
+import tracemalloc
+import math
 import random
-import matplotlib.pyplot as plt
+import numpy as np
+from tabulate import tabulate
+
+
+# Typed Buffer Helpers
+def is_typed_buffer(arr):
+    """Return True for array.array and memoryview inputs."""
+    return isinstance(arr, (array.array, memoryview))
+
+
+def copy_slice(arr, start=0, stop=None):
+    """Copy arr[start:stop] into a container of the same element type.
+
+    Slicing a memoryview returns a view onto the same buffer, so memoryview
+    slices are copied into a compact array.array with the view's typecode.
+    """
+    if isinstance(arr, memoryview):
+        return array.array(arr.format, arr[start:stop].tobytes())
+    return arr[start:stop]
+
+
+def assign_all(arr, values):
+    """Overwrite every item of arr in place with values."""
+    if is_typed_buffer(arr):
+        typecode = arr.format if isinstance(arr, memoryview) else arr.typecode
+        arr[:] = array.array(typecode, values)
+    else:
+        arr[:] = values
 
 
 # Sorting Algorithms
-def merge_sort(arr):
-    """Perform merge sort on a list."""
-    if len(arr) > 1:
+def keyed_sort(sort, arr, key=None, reverse=False):
+    """Sort a list by key with a raw-comparison sorting algorithm.
+
+    Each key is computed exactly once and paired with its position, the
+    pairs are sorted by ``sort`` and the records are permuted once at the
+    end. The position breaks ties, so the result is stable and records are
+    never compared directly. A descending sort reverses the input before
+    and the output after sorting, which keeps equal keys in input order.
+    """
+    records = copy_slice(arr)
+    if reverse:
+        records.reverse()
+    keys = records if key is None else map(key, records)
+    decorated = list(zip(keys, range(len(records))))
+    sort(decorated)
+    if reverse:
+        decorated.reverse()
+    assign_all(arr, [records[i] for _, i in decorated])
+
+
+def merge_sort(arr, key=None, reverse=False):
+    """Perform merge sort on a list or typed buffer."""
+    if key is not None or reverse:
+        keyed_sort(merge_sort, arr, key, reverse)
+    elif len(arr) > 1:
         mid = len(arr) // 2
-        left_half = arr[:mid]
-        right_half = arr[mid:]
+        left_half = copy_slice(arr, 0, mid)
+        right_half = copy_slice(arr, mid)
 
         merge_sort(left_half)
         merge_sort(right_half)
@@ -40,20 +94,175 @@ def merge(arr, left_half, right_half):
         k += 1
 
 
-def insertion_sort(arr):
-    """Perform insertion sort on a list."""
+def insertion_sort(arr, key=None, reverse=False):
+    """Perform insertion sort on a list or typed buffer."""
+    if key is not None or reverse:
+        keyed_sort(insertion_sort, arr, key, reverse)
+        return
     for i in range(1, len(arr)):
-        key = arr[i]
+        current = arr[i]
         j = i - 1
-        while j >= 0 and key < arr[j]:
+        while j >= 0 and current < arr[j]:
             arr[j + 1] = arr[j]
             j -= 1
-        arr[j + 1] = key
+        arr[j + 1] = current
+
+
+def tim_sort(arr, key=None, reverse=False):
+    """Utilize Python's built-in sort (TimSort) on a list.
+
+    Typed buffers have no sort method; they are sorted in place through a
+    NumPy view of their memory with NumPy's stable sort.
+    """
+    if not is_typed_buffer(arr):
+        arr.sort(key=key, reverse=reverse)
+    elif key is not None or reverse:
+        keyed_sort(tim_sort, arr, key, reverse)
+    else:
+        np.asarray(arr).sort(kind="stable")
+
+
+def argsort_sort(arr, key=None, reverse=False):
+    """Sort a list by numeric keys with a NumPy argsort.
+
+    Keys are computed once into an array, ordered with a stable argsort and
+    the records are permuted in a single pass.
+    """
+    keys = np.array(arr if key is None else [key(record) for record in arr])
+    if reverse:
+        # Stable descending order: argsort the reversed keys, then map back
+        order = (len(keys) - 1 - np.argsort(keys[::-1], kind="stable"))[::-1]
+    else:
+        order = np.argsort(keys, kind="stable")
+    records = copy_slice(arr)
+    assign_all(arr, [records[i] for i in order.tolist()])
+
+
+ALGORITHMS = {
+    "Merge Sort": merge_sort,
+    "Insertion Sort": insertion_sort,
+    "TimSort": tim_sort,
+}
+
+
+# Selection Algorithms
+SELECTION_BACKENDS = ("introselect", "heapq", "numpy")
+
+
+def _check_backend(backend):
+    """Raise ValueError for an unknown selection backend."""
+    if backend not in SELECTION_BACKENDS:
+        raise ValueError(f"Selection backend {backend} not found")
+
+
+def _partition3(arr, lo, hi, pivot):
+    """Three-way partition of arr[lo:hi + 1] around a pivot value.
 
+    Returns the bounds (lt, gt) of the block equal to the pivot, with smaller
+    items before it and larger items after it.
+    """
+    lt, i, gt = lo, lo, hi
+    while i <= gt:
+        if arr[i] < pivot:
+            arr[lt], arr[i] = arr[i], arr[lt]
+            lt += 1
+            i += 1
+        elif pivot < arr[i]:
+            arr[gt], arr[i] = arr[i], arr[gt]
+            gt -= 1
+        else:
+            i += 1
+    return lt, gt
+
+
+def introselect(arr, n):
+    """Quickselect with a median-of-three pivot and a depth limit.
+
+    Once the recursion depth exceeds 2 * log2(len(arr)) the remaining range
+    is sorted outright, which bounds the worst case at O(n log n).
+    """
+    lo, hi = 0, len(arr) - 1
+    depth_limit = 2 * int(math.log2(len(arr))) if arr else 0
+    while lo < hi:
+        if depth_limit == 0:
+            arr[lo : hi + 1] = sorted(arr[lo : hi + 1])
+            return
+        depth_limit -= 1
+        mid = (lo + hi) // 2
+        pivot = sorted((arr[lo], arr[mid], arr[hi]))[1]
+        lt, gt = _partition3(arr, lo, hi, pivot)
+        if n < lt:
+            hi = lt - 1
+        elif n > gt:
+            lo = gt + 1
+        else:
+            return
+
+
+def _heap_select(arr, k):
+    """Move the k smallest items of arr to its front in sorted order."""
+    heap = arr[:]
+    heapq.heapify(heap)
+    head = [heapq.heappop(heap) for _ in range(k)]
+    arr[:] = head + heap
+
+
+def nth_element(arr, n, backend="introselect"):
+    """Rearrange a list so arr[n] holds the item it would have if sorted.
+
+    Items before position n are not greater than it and items after it are
+    not smaller. Returns arr[n].
+    """
+    _check_backend(backend)
+    if not -len(arr) <= n < len(arr):
+        raise IndexError("list index out of range")
+    n %= len(arr)
+    if backend == "introselect":
+        introselect(arr, n)
+    elif backend == "heapq":
+        _heap_select(arr, n + 1)
+    else:
+        arr[:] = np.partition(arr, n).tolist()
+    return arr[n]
 
-def tim_sort(arr):
-    """Utilize Python's built-in sort (TimSort) on a list."""
-    arr.sort()
+
+def partial_sort(arr, k, backend="introselect"):
+    """Rearrange a list so arr[:k] holds its k smallest items in sorted order."""
+    _check_backend(backend)
+    k = max(0, min(k, len(arr)))
+    if k == 0:
+        return
+    if backend == "introselect":
+        introselect(arr, k - 1)
+        arr[:k] = sorted(arr[:k])
+    elif backend == "heapq":
+        _heap_select(arr, k)
+    else:
+        partitioned = np.partition(arr, k - 1)
+        partitioned[:k].sort()
+        arr[:] = partitioned.tolist()
+
+
+def top_k(arr, k, largest=True, backend="introselect"):
+    """Return the k largest (or smallest) items of a list without modifying it.
+
+    The result is ordered from the most to the least extreme item.
+    """
+    _check_backend(backend)
+    k = max(0, min(k, len(arr)))
+    if k == 0:
+        return []
+    if backend == "heapq":
+        return heapq.nlargest(k, arr) if largest else heapq.nsmallest(k, arr)
+    n = len(arr) - k if largest else k - 1
+    if backend == "introselect":
+        data_copy = arr[:]
+        introselect(data_copy, n)
+        selected = data_copy[n:] if largest else data_copy[:k]
+    else:
+        selected = np.partition(arr, n)[n:] if largest else np.partition(arr, n)[:k]
+        selected = selected.tolist()
+    return sorted(selected, reverse=largest)
 
 
 # Utility Functions
@@ -62,6 +271,25 @@ def generate_random_data(size):
     return [random.randint(1, 1000) for _ in range(size)]
 
 
+def generate_random_records(size):
+    """Generate a list of order-like dict records."""
+    return [
+        {
+            "id": i,
+            "price": round(random.uniform(1, 100), 2),
+            "quantity": random.randint(1, 50),
+            "discount": random.choice((0.0, 0.05, 0.1, 0.2)),
+        }
+        for i in range(size)
+    ]
+
+
+def record_key(record):
+    """Compute the net total of a record, used as its sort key."""
+    gross = record["price"] * record["quantity"]
+    return round(gross * (1 - record["discount"]), 2)
+
+
 def run_sorting_algorithm(algorithm, size):
     """Run a sorting algorithm and measure its execution time."""
     setup_code = f"from _sort_func_ import {algorithm}, generate_random_data"
@@ -72,8 +300,94 @@ def run_sorting_algorithm(algorithm, size):
     return min(times) / repeat_number  # Return the average time per execution
 
 
+def run_on_pregenerated_data(function_name, size, extra_args=""):
+    """Measure a function on a copy of random data generated outside the timer.
+
+    Only the copy and the call itself are timed, so cheap operations are not
+    swamped by the cost of generate_random_data.
+    """
+    setup_code = (
+        f"from _sort_func_ import {function_name}, generate_random_data; "
+        f"data = generate_random_data({size})"
+    )
+    stmt = f"data_copy = data.copy(); {function_name}(data_copy{extra_args})"
+    repeat_number = 10
+    times = timeit.repeat(stmt, setup=setup_code, number=repeat_number, repeat=3)
+    return min(times) / repeat_number
+
+
+def run_selection_algorithm(backend, size, k):
+    """Run partial_sort with a selection backend and measure its execution time."""
+    return run_on_pregenerated_data("partial_sort", size, f", {k}, backend={backend!r}")
+
+
+def run_keyed_sorting_algorithm(algorithm, records, key=record_key):
+    """Sort a copy of the records by key and measure the execution time."""
+    repeat_number = 10
+    times = timeit.repeat(
+        lambda: algorithm(records[:], key=key), number=repeat_number, repeat=3
+    )
+    return min(times) / repeat_number
+
+
+def generate_typed_containers(size):
+    """Generate the same random integers as a list and as typed buffers."""
+    data = generate_random_data(size)
+    return {
+        "list": data,
+        "array('i')": array.array("i", data),
+        "array('q')": array.array("q", data),
+        "array('d')": array.array("d", data),
+        "memoryview('q')": memoryview(array.array("q", data)),
+    }
+
+
+def container_footprint(container):
+    """Bytes held by a container, including boxed items for lists."""
+    if isinstance(container, memoryview):
+        return sys.getsizeof(container) + container.nbytes
+    if isinstance(container, array.array):
+        return sys.getsizeof(container)
+    return sys.getsizeof(container) + sum(sys.getsizeof(item) for item in container)
+
+
+def copy_container(container):
+    """Copy a container, keeping its type.
+
+    A memoryview is copied into a fresh array.array and wrapped in a new
+    memoryview, so memoryview inputs are measured as memoryviews.
+    """
+    if isinstance(container, memoryview):
+        return memoryview(array.array(container.format, container.tobytes()))
+    return container[:]
+
+
+def run_typed_sorting_algorithm(algorithm, container, repeat=3):
+    """Sort fresh copies of a container and measure time and peak allocation.
+
+    Returns the minimum execution time and the peak memory allocated while
+    sorting, as reported by tracemalloc in a separate untimed run.
+    """
+    times = []
+    for _ in range(repeat):
+        container_copy = copy_container(container)
+        start = timeit.default_timer()
+        algorithm(container_copy)
+        times.append(timeit.default_timer() - start)
+
+    container_copy = copy_container(container)
+    tracemalloc.start()
+    algorithm(container_copy)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return min(times), peak
+
+
 def display_results(results, data_sizes):
     """Display a plot comparing the performance of different sorting algorithms."""
+    # Imported lazily so spawned measurement workers skip loading pyplot
+    import matplotlib.pyplot as plt
+
     for algorithm, times in results.items():
         plt.plot(data_sizes, times, label=algorithm)
     plt.xlabel("Data Size")
@@ -83,28 +397,137 @@ def display_results(results, data_sizes):
     plt.show()
 
 
+def iter_results(data_sizes, skip=()):
+    """Yield (algorithm, size, time) as soon as each measurement finishes.
+
+    Measurements whose (algorithm, size) pair is in ``skip`` are not run.
+    """
+    for size in data_sizes:
+        for alg_name, alg_func in ALGORITHMS.items():
+            if (alg_name, size) in skip:
+                continue
+            yield alg_name, size, run_sorting_algorithm(alg_func.__name__, size)
+
+
 # Main Function
 def main(data_sizes, show_results=True, return_results=False):
     """Compare the performance of various sorting algorithms across different data sizes."""
-    algorithms = {
-        "Merge Sort": merge_sort,
-        "Insertion Sort": insertion_sort,
-        "TimSort": tim_sort,
+    results = {alg: [] for alg in ALGORITHMS}
+
+    for alg_name, size, execution_time in iter_results(data_sizes):
+        results[alg_name].append(execution_time)
+
+    if show_results:
+        display_results(results, data_sizes)
+    if return_results:
+        return results
+
+
+def selection_main(
+    data_sizes, k_values=(1, 10, 100), show_results=True, return_results=False
+):
+    """Compare partial_sort backends with full sorts for several values of k.
+
+    Returns a mapping of k to per-method timings; k is capped at each size.
+    """
+    full_sorts = {"TimSort": tim_sort, "Merge Sort": merge_sort}
+    # Full sorts do not depend on k, so they are measured once per size
+    full_sort_results = {
+        alg_name: [
+            run_on_pregenerated_data(alg_func.__name__, size) for size in data_sizes
+        ]
+        for alg_name, alg_func in full_sorts.items()
     }
+    results = {}
+
+    for k in k_values:
+        results[k] = {f"Partial Sort ({backend})": [] for backend in SELECTION_BACKENDS}
+        for size in data_sizes:
+            for backend in SELECTION_BACKENDS:
+                execution_time = run_selection_algorithm(backend, size, min(k, size))
+                results[k][f"Partial Sort ({backend})"].append(execution_time)
+        results[k].update(full_sort_results)
 
+    if show_results:
+        for k, k_results in results.items():
+            print(f"\nPartial sort with k = {k}:")
+            rows = [
+                [size] + [times[i] for times in k_results.values()]
+                for i, size in enumerate(data_sizes)
+            ]
+            print(
+                tabulate(rows, headers=["Data Size"] + list(k_results), tablefmt="pipe")
+            )
+            display_results(k_results, data_sizes)
+    if return_results:
+        return results
+
+
+def key_main(data_sizes, show_results=True, return_results=False):
+    """Compare keyed sorting of dict records across algorithms and the argsort path."""
+    algorithms = dict(ALGORITHMS, **{"ArgSort (NumPy)": argsort_sort})
     results = {alg: [] for alg in algorithms}
 
     for size in data_sizes:
+        records = generate_random_records(size)
         for alg_name, alg_func in algorithms.items():
-            execution_time = run_sorting_algorithm(alg_func.__name__, size)
+            execution_time = run_keyed_sorting_algorithm(alg_func, records)
             results[alg_name].append(execution_time)
 
     if show_results:
+        rows = [
+            [size] + [times[i] for times in results.values()]
+            for i, size in enumerate(data_sizes)
+        ]
+        print(tabulate(rows, headers=["Data Size"] + list(results), tablefmt="pipe"))
         display_results(results, data_sizes)
     if return_results:
         return results
 
 
+def typed_main(data_sizes, show_results=True, return_results=False):
+    """Compare list inputs with array.array and memoryview inputs.
+
+    Returns rows of (size, algorithm, container, time, peak sort memory,
+    container footprint). tim_sort sorts typed buffers with NumPy's stable
+    sort rather than TimSort, so those rows are labelled as such.
+    """
+    results = []
+
+    for size in data_sizes:
+        containers = generate_typed_containers(size)
+        for alg_name, alg_func in ALGORITHMS.items():
+            for container_name, container in containers.items():
+                execution_time, peak = run_typed_sorting_algorithm(alg_func, container)
+                if alg_func is tim_sort and is_typed_buffer(container):
+                    label = "NumPy stable sort"
+                else:
+                    label = alg_name
+                results.append(
+                    [
+                        size,
+                        label,
+                        container_name,
+                        execution_time,
+                        peak / 1024,
+                        container_footprint(container) / 1024,
+                    ]
+                )
+
+    if show_results:
+        headers = [
+            "Data Size",
+            "Algorithm",
+            "Container",
+            "Time (s)",
+            "Peak Sort Memory (KiB)",
+            "Footprint (KiB)",
+        ]
+        print(tabulate(results, headers=headers, tablefmt="pipe", floatfmt=".3g"))
+    if return_results:
+        return results
+
+
 # Execute if this is the main module
 if __name__ == "__main__":
     data_sizes = [100, 500, 1000, 3000]
@@ -0,0 +1,289 @@
+import os
+import sys
+import random
+from bisect import bisect_left, bisect_right, insort
+from itertools import accumulate, chain
+import matplotlib.pyplot as plt
+from tabulate import tabulate
+
+sys.path.append(
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "sort_classes")
+)
+from _sort_classes_ import SortingHandler, TimeMeasurer  # noqa: E402
+
+
+class SortedList:
+    """Sorted sequence stored as a list of bounded, individually sorted chunks.
+
+    Each chunk holds at most ``2 * load`` items, so an insert or delete only
+    shifts a short list. ``_maxes`` keeps the last item of every chunk for a
+    bisect-based chunk lookup, and ``_offsets`` keeps the cumulative chunk
+    lengths for index access; it is rebuilt lazily after a modification.
+    """
+
+    def __init__(self, iterable=(), load=500):
+        self._load = load
+        self._lists = []
+        self._maxes = []
+        self._offsets = None
+        self._len = 0
+        self.update(iterable)
+
+    def __len__(self):
+        return self._len
+
+    def __iter__(self):
+        return chain.from_iterable(self._lists)
+
+    def __contains__(self, value):
+        pos = bisect_left(self._maxes, value)
+        if pos == len(self._maxes):
+            return False
+        chunk = self._lists[pos]
+        idx = bisect_left(chunk, value)
+        return chunk[idx] == value
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return list(self)[index]
+        pos, idx = self._locate(index)
+        return self._lists[pos][idx]
+
+    def __delitem__(self, index):
+        pos, idx = self._locate(index)
+        self._delete(pos, idx)
+
+    def __repr__(self):
+        return f"{type(self).__name__}({list(self)!r})"
+
+    def add(self, value):
+        """Insert a value, keeping the sequence sorted."""
+        if not self._maxes:
+            self._lists.append([value])
+            self._maxes.append(value)
+        else:
+            pos = bisect_right(self._maxes, value)
+            if pos == len(self._maxes):
+                pos -= 1
+                self._lists[pos].append(value)
+                self._maxes[pos] = value
+            else:
+                insort(self._lists[pos], value)
+            self._split(pos)
+        self._len += 1
+        self._offsets = None
+
+    def update(self, iterable):
+        """Insert every value from an iterable.
+
+        Large batches are merged with the existing items and re-chunked in one
+        pass, which is cheaper than inserting them one at a time.
+        """
+        values = list(iterable)
+        if len(values) * 4 < self._len:
+            for value in values:
+                self.add(value)
+            return
+        values.extend(self)
+        values.sort()
+        load = self._load
+        self._lists = [values[i : i + load] for i in range(0, len(values), load)]
+        self._maxes = [chunk[-1] for chunk in self._lists]
+        self._len = len(values)
+        self._offsets = None
+
+    def remove(self, value):
+        """Remove one occurrence of a value; raise ValueError if it is absent."""
+        pos = bisect_left(self._maxes, value)
+        if pos < len(self._maxes):
+            idx = bisect_left(self._lists[pos], value)
+            if self._lists[pos][idx] == value:
+                self._delete(pos, idx)
+                return
+        raise ValueError(f"{value!r} not in list")
+
+    def discard(self, value):
+        """Remove one occurrence of a value if it is present."""
+        try:
+            self.remove(value)
+        except ValueError:
+            pass
+
+    def pop(self, index=-1):
+        """Remove and return the item at the given index."""
+        pos, idx = self._locate(index)
+        value = self._lists[pos][idx]
+        self._delete(pos, idx)
+        return value
+
+    def bisect_left(self, value):
+        """Return the index where value would be inserted before equal items."""
+        pos = bisect_left(self._maxes, value)
+        if pos == len(self._maxes):
+            return self._len
+        return self._offset(pos) + bisect_left(self._lists[pos], value)
+
+    def bisect_right(self, value):
+        """Return the index where value would be inserted after equal items."""
+        pos = bisect_right(self._maxes, value)
+        if pos == len(self._maxes):
+            return self._len
+        return self._offset(pos) + bisect_right(self._lists[pos], value)
+
+    def index(self, value):
+        """Return the index of the first occurrence of a value."""
+        idx = self.bisect_left(value)
+        if idx == self._len or self[idx] != value:
+            raise ValueError(f"{value!r} not in list")
+        return idx
+
+    def count(self, value):
+        """Return the number of occurrences of a value."""
+        return self.bisect_right(value) - self.bisect_left(value)
+
+    def irange(self, minimum, maximum, inclusive=(True, True)):
+        """Iterate over the values between minimum and maximum in sorted order."""
+        start = (self.bisect_left if inclusive[0] else self.bisect_right)(minimum)
+        stop = (self.bisect_right if inclusive[1] else self.bisect_left)(maximum)
+        if start >= stop:
+            return
+        pos, idx = self._locate(start)
+        for _ in range(stop - start):
+            chunk = self._lists[pos]
+            yield chunk[idx]
+            idx += 1
+            if idx == len(chunk):
+                pos, idx = pos + 1, 0
+
+    def _offset(self, pos):
+        """Number of items stored before chunk ``pos``."""
+        if self._offsets is None:
+            self._offsets = [0] + list(accumulate(map(len, self._lists)))
+        return self._offsets[pos]
+
+    def _locate(self, index):
+        """Translate a flat index into a (chunk, position) pair."""
+        if index < 0:
+            index += self._len
+        if not 0 <= index < self._len:
+            raise IndexError("list index out of range")
+        self._offset(0)
+        pos = bisect_right(self._offsets, index) - 1
+        return pos, index - self._offsets[pos]
+
+    def _split(self, pos):
+        """Split chunk ``pos`` in two when it grows past twice the load."""
+        chunk = self._lists[pos]
+        if len(chunk) > 2 * self._load:
+            half = chunk[self._load :]
+            del chunk[self._load :]
+            self._maxes[pos] = chunk[-1]
+            self._lists.insert(pos + 1, half)
+            self._maxes.insert(pos + 1, half[-1])
+
+    def _delete(self, pos, idx):
+        """Delete the item at ``idx`` within chunk ``pos``."""
+        chunk = self._lists[pos]
+        del chunk[idx]
+        self._len -= 1
+        self._offsets = None
+        if chunk:
+            self._maxes[pos] = chunk[-1]
+        else:
+            del self._lists[pos]
+            del self._maxes[pos]
+
+
+# Utility functions
+def generate_random_batches(size, batch_size):
+    """Generate ``size`` random integers split into batches of ``batch_size``."""
+    data = [random.randint(1, 1000) for _ in range(size)]
+    return [data[i : i + batch_size] for i in range(0, size, batch_size)]
+
+
+def run_sorted_container(batches):
+    """Insert every batch into a SortedList, reading sorted order after each."""
+    container = SortedList()
+    for batch in batches:
+        container.update(batch)
+        container[-1]
+    return container
+
+
+def run_resorting(sorting_handler, algorithm_name, batches):
+    """Append every batch to a list and re-sort it through perform_sorting."""
+    data = []
+    for batch in batches:
+        data.extend(batch)
+        data = sorting_handler.perform_sorting(algorithm_name, data)
+    return data
+
+
+class ResultHandler:
+    """Handles displaying and plotting of the incremental workload results."""
+
+    @staticmethod
+    def display_table(data_sizes, results):
+        """Display results in a table format."""
+        headers = ["Data Size"] + list(results)
+        rows = [
+            [size] + [results[method][i] for method in results]
+            for i, size in enumerate(data_sizes)
+        ]
+        print(tabulate(rows, headers=headers, tablefmt="pipe"))
+
+    @staticmethod
+    def plot_results(data_sizes, results):
+        """Plots the incremental workload results."""
+        for method, execution_times in results.items():
+            plt.plot(data_sizes, execution_times, label=method)
+        plt.xlabel("Data Size")
+        plt.ylabel("Execution Time (seconds)")
+        plt.title("Sorted Container vs. Re-sorting after Every Batch")
+        plt.legend()
+        plt.show()
+
+
+class MainProgram:
+    """Compares a SortedList with re-sorting after every batch of k inserts."""
+
+    def __init__(self, data_sizes, batch_size=100):
+        self.data_sizes = data_sizes
+        self.batch_size = batch_size
+        self.sorting_handler = SortingHandler()
+        self.results = {"Sorted List": []}
+        self.results.update(
+            {f"Re-sort {alg}": [] for alg in self.sorting_handler.algorithms}
+        )
+
+    def run(self, show_results=True, return_results=False):
+        """Executes the workload comparison for the specified data sizes."""
+        for size in self.data_sizes:
+            batches = generate_random_batches(size, self.batch_size)
+            self.results["Sorted List"].append(
+                TimeMeasurer.measure_time(run_sorted_container, batches, number=1)
+            )
+            for algorithm in self.sorting_handler.algorithms:
+                self.results[f"Re-sort {algorithm}"].append(
+                    TimeMeasurer.measure_time(
+                        run_resorting,
+                        self.sorting_handler,
+                        algorithm,
+                        batches,
+                        number=1,
+                    )
+                )
+
+        if show_results:
+            ResultHandler.display_table(self.data_sizes, self.results)
+            ResultHandler.plot_results(self.data_sizes, self.results)
+
+        if return_results:
+            return self.results
+
+
+# Main execution block
+if __name__ == "__main__":
+    data_sizes = [100, 500, 1000, 3000]
+    program = MainProgram(data_sizes)
+    program.run()
@@ -0,0 +1,297 @@
+import os
+import sys
+import json
+import time
+import asyncio
+import threading
+from collections import Counter
+
+sys.path.append(
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "isolation")
+)
+from _isolation_ import IMPLEMENTATIONS, iter_cells  # noqa: E402
+import _sort_func_  # noqa: E402
+import _sort_classes_  # noqa: E402
+
+HARNESSES = ("legacy", "cell")
+
+
+def cell_key(record):
+    """Return the (implementation, algorithm, size) cell a record belongs to."""
+    return record["implementation"], record["algorithm"], record["size"]
+
+
+def load_checkpoint(checkpoint_path):
+    """Read a checkpoint file; a missing or empty file means nothing is done.
+
+    A partially written last line (from an interrupted write) is cut off the
+    file so that new records are appended after the last complete one.
+
+    Returns:
+        (header, records): the sweep description written on the first line,
+        or None for an empty file, and the measurement records after it.
+    """
+    if checkpoint_path is None or not os.path.exists(checkpoint_path):
+        return None, []
+    lines = []
+    valid_bytes = 0
+    with open(checkpoint_path, "rb") as checkpoint:
+        for line in checkpoint:
+            if not line.endswith(b"\n"):
+                break
+            try:
+                lines.append(json.loads(line))
+            except json.JSONDecodeError:
+                break
+            valid_bytes += len(line)
+    if valid_bytes != os.path.getsize(checkpoint_path):
+        with open(checkpoint_path, "r+b") as checkpoint:
+            checkpoint.truncate(valid_bytes)
+    if not lines:
+        return None, []
+    header = lines[0].get("checkpoint") if isinstance(lines[0], dict) else None
+    if header is None:
+        raise ValueError(
+            f"Checkpoint {checkpoint_path} has no sweep header; "
+            "delete it or choose another path"
+        )
+    return header, lines[1:]
+
+
+def iter_legacy_cells(data_sizes, skip=None):
+    """Measure with the original harnesses, yielding records as they finish.
+
+    The function-based implementation runs first through
+    ``_sort_func_.iter_results`` (whose timing includes generating the
+    data), then the class-based one through ``MainProgram.iter_run``,
+    exactly as a plain comparison run does.
+    """
+    skip = skip or {}
+    func_skip = {(alg, size) for impl, alg, size in skip if impl == "func"}
+    class_skip = {(alg, size) for impl, alg, size in skip if impl == "class"}
+    sort_classes = _sort_classes_.MainProgram(data_sizes)
+    for implementation, results in (
+        ("func", _sort_func_.iter_results(data_sizes, skip=func_skip)),
+        ("class", sort_classes.iter_run(skip=class_skip)),
+    ):
+        for algorithm, size, execution_time in results:
+            yield {
+                "implementation": implementation,
+                "algorithm": algorithm,
+                "size": size,
+                "time": execution_time,
+            }
+
+
+class ProgressDisplay:
+    """Prints a single updating progress line with an ETA to stderr.
+
+    Cells are weighted by their data size, so the ETA accounts for larger
+    sizes taking longer than the cells measured so far.
+    """
+
+    def __init__(self, cells, stream=sys.stderr):
+        self.stream = stream
+        self.total_cells = len(cells)
+        self.total_weight = sum(size for _, _, size in cells)
+        self.done_cells = 0
+        self.done_weight = 0
+        self.measured_weight = 0
+        self.start = time.perf_counter()
+
+    def resume(self, records):
+        """Count records restored from a checkpoint as done (not timed)."""
+        for record in records:
+            self.done_cells += 1
+            self.done_weight += record["size"]
+
+    def update(self, record):
+        """Account for a freshly measured record and redraw the line."""
+        self.done_cells += 1
+        self.done_weight += record["size"]
+        self.measured_weight += record["size"]
+        elapsed = time.perf_counter() - self.start
+        remaining = self.total_weight - self.done_weight
+        eta = elapsed * remaining / self.measured_weight
+        percent = 100 * self.done_weight / self.total_weight
+        self.stream.write(
+            f"\r[{self.done_cells}/{self.total_cells}] {percent:5.1f}% "
+            f"{record['implementation']:<5} {record['algorithm']:<14} "
+            f"n={record['size']:<6} elapsed {elapsed:7.1f}s ETA {eta:7.1f}s"
+        )
+        if self.done_cells == self.total_cells:
+            self.stream.write("\n")
+        self.stream.flush()
+
+
+def sweep_options(harness, isolated, interleaved, rounds, number, warmup):
+    """Return the options that determine how a sweep's records were measured."""
+    if harness not in HARNESSES:
+        raise ValueError(f"Harness {harness} not found")
+    if harness == "legacy":
+        if isolated or interleaved:
+            raise ValueError("isolated and interleaved need harness='cell'")
+        return {"harness": harness}
+    return {
+        "harness": harness,
+        "isolated": isolated,
+        "interleaved": interleaved,
+        "rounds": rounds,
+        "number": number,
+        "warmup": warmup,
+    }
+
+
+def stream_measurements(
+    data_sizes,
+    checkpoint_path=None,
+    cache=None,
+    show_progress=True,
+    harness="legacy",
+    isolated=False,
+    interleaved=False,
+    rounds=3,
+    number=10,
+    warmup=3,
+):
+    """Yield each measurement record as soon as its cell finishes.
+
+    The checkpoint file starts with a header holding the data sizes and the
+    measurement options. Resuming from it requires the same header, so
+    records measured under other conditions are never mixed in. Records
+    already in the checkpoint are yielded first and their cells are not
+    measured again. Every new record is appended to the file and flushed
+    before it is yielded, so an interrupted sweep resumes where it stopped.
+
+    Args:
+        data_sizes: A list of data sizes to test the algorithms with.
+        checkpoint_path: Optional JSON-lines file used to save and resume.
+        cache: Optional MeasurementCache; cells with an up-to-date cached
+            record are yielded from it (marked ``cached``) instead of being
+            measured, and new records are added to it. Both are keyed on
+            the harness and measurement options of this call.
+        show_progress: Print a live progress line with an ETA.
+        harness: "legacy" measures like a plain comparison run (one record
+            per cell); "cell" uses the isolation module's per-cell harness.
+        isolated, interleaved, rounds, number, warmup: Passed to iter_cells
+            with the "cell" harness.
+
+    Raises:
+        ValueError: If the checkpoint was written by a different sweep.
+    """
+    options = sweep_options(harness, isolated, interleaved, rounds, number, warmup)
+    if harness == "legacy":
+        rounds = 1
+    sweep = {"data_sizes": list(data_sizes), "options": options}
+    header, done = load_checkpoint(checkpoint_path)
+    if header is not None and header != sweep:
+        raise ValueError(
+            f"Checkpoint {checkpoint_path} was written by a different sweep "
+            f"({header}); delete it or choose another path"
+        )
+
+    algorithms = list(_sort_func_.ALGORITHMS)
+    cells = [
+        (implementation, algorithm, size)
+        for size in data_sizes
+        for algorithm in algorithms
+        for implementation in IMPLEMENTATIONS
+        for _ in range(rounds)
+    ]
+    skip = Counter(cell_key(record) for record in done)
+    cached = []
+    if cache is not None:
+        for cell in dict.fromkeys(cells):
+            missing = rounds - skip[cell]
+            if missing > 0:
+                cached.extend(
+                    dict(record, cached=True)
+                    for record in cache.lookup(*cell, missing, options)
+                )
+        skip.update(cell_key(record) for record in cached)
+
+    progress = ProgressDisplay(cells) if show_progress else None
+    if progress:
+        progress.resume(done + cached)
+    yield from done
+    yield from cached
+
+    checkpoint = None
+    if checkpoint_path is not None:
+        checkpoint = open(checkpoint_path, "a", encoding="utf-8")
+        if header is None:
+            checkpoint.write(json.dumps({"checkpoint": sweep}) + "\n")
+            checkpoint.flush()
+    if harness == "legacy":
+        records = iter_legacy_cells(data_sizes, skip=skip)
+    else:
+        records = iter_cells(
+            data_sizes,
+            isolated=isolated,
+            interleaved=interleaved,
+            rounds=rounds,
+            number=number,
+            warmup=warmup,
+            skip=skip,
+        )
+    try:
+        for record in records:
+            if cache is not None:
+                cache.add(record, options)
+            if checkpoint:
+                checkpoint.write(json.dumps(record) + "\n")
+                checkpoint.flush()
+            if progress:
+                progress.update(record)
+            yield record
+    finally:
+        if checkpoint:
+            checkpoint.close()
+
+
+async def astream_measurements(data_sizes, **options):
+    """Async-iterator version of stream_measurements.
+
+    One worker thread drives stream_measurements from start to finish and
+    hands records to the event loop through a queue, so the loop stays free
+    while a measurement is running. When the consumer stops early or is
+    cancelled, the worker finishes the cell in progress, closes the
+    generator (and with it the checkpoint file) from its own thread, and
+    the consumer waits for that before the cancellation propagates.
+    """
+    loop = asyncio.get_running_loop()
+    queue = asyncio.Queue()
+    stop = threading.Event()
+
+    def publish(record, error):
+        try:
+            loop.call_soon_threadsafe(queue.put_nowait, (record, error))
+        except RuntimeError:  # The event loop has already been closed
+            pass
+
+    def produce():
+        records = stream_measurements(data_sizes, **options)
+        try:
+            for record in records:
+                publish(record, None)
+                if stop.is_set():
+                    break
+            publish(None, None)
+        except Exception as error:
+            publish(None, error)
+        finally:
+            records.close()
+
+    worker = threading.Thread(target=produce, daemon=True)
+    worker.start()
+    try:
+        while True:
+            record, error = await queue.get()
+            if error is not None:
+                raise error
+            if record is None:
+                break
+            yield record
+    finally:
+        stop.set()
+        await asyncio.shield(asyncio.to_thread(worker.join))
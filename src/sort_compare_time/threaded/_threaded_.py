@@ -0,0 +1,188 @@
+import os
+import sys
+import timeit
+from concurrent.futures import ThreadPoolExecutor
+import matplotlib.pyplot as plt
+from tabulate import tabulate
+
+sys.path.append(
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "sort_classes")
+)
+from _sort_classes_ import (  # noqa: E402
+    SortingHandler,
+    TimeMeasurer,
+    assign_all,
+    generate_random_data,
+)
+
+
+def gil_enabled():
+    """Return False on a free-threaded CPython build running without the GIL."""
+    return getattr(sys, "_is_gil_enabled", lambda: True)()
+
+
+def run_jobs(jobs, workers, sorting_handler=None):
+    """Run independent sort jobs concurrently on a thread pool.
+
+    Args:
+        jobs: A list of (algorithm_name, data) pairs.
+        workers: Number of threads.
+        sorting_handler: The SortingHandler whose algorithms run the jobs.
+
+    Returns:
+        The sorted copies, in job order.
+    """
+    sorting_handler = sorting_handler or SortingHandler()
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(
+            executor.map(lambda job: sorting_handler.perform_sorting(*job), jobs)
+        )
+
+
+def parallel_merge_sort(
+    data, workers=4, algorithm_name="Merge Sort", sorting_handler=None
+):
+    """Sort data in place by sorting chunks on a thread pool and merging them.
+
+    The data is split into one chunk per worker, each chunk is sorted with
+    the registered ``algorithm_name``, and sorted runs are then merged
+    pairwise, each merge round also running on the pool, with the merge
+    step of the registered merge sort.
+    """
+    sorting_handler = sorting_handler or SortingHandler()
+    merge = sorting_handler.algorithms["Merge Sort"]._merge
+    chunk_size = -(-len(data) // workers) or 1
+    chunks = [data[i : i + chunk_size] for i in range(0, len(data), chunk_size)]
+
+    def merge_pair(pair):
+        left, right = pair
+        merged = left + right
+        merge(merged, left, right)
+        return merged
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        runs = list(
+            executor.map(
+                lambda chunk: sorting_handler.perform_sorting(algorithm_name, chunk),
+                chunks,
+            )
+        )
+        while len(runs) > 1:
+            pairs = list(zip(runs[0::2], runs[1::2]))
+            leftover = [runs[-1]] if len(runs) % 2 else []
+            runs = list(executor.map(merge_pair, pairs)) + leftover
+    if runs:
+        assign_all(data, runs[0])
+
+
+class ResultHandler:
+    """Handles displaying and plotting of thread scaling results."""
+
+    @staticmethod
+    def display_tables(throughput_rows, parallel_rows):
+        """Display job throughput and parallel merge sort results as tables."""
+        print(f"GIL enabled: {gil_enabled()}")
+        print("\nThread-pool job throughput:")
+        print(
+            tabulate(
+                throughput_rows,
+                headers=["Data Size", "Algorithm", "Threads", "Jobs/s", "Scaling"],
+                tablefmt="pipe",
+            )
+        )
+        print("\nParallel merge sort:")
+        print(
+            tabulate(
+                parallel_rows,
+                headers=["Data Size", "Threads", "Time (s)", "Speedup"],
+                tablefmt="pipe",
+            )
+        )
+
+    @staticmethod
+    def plot_results(thread_counts, scaling):
+        """Plots throughput scaling against the number of threads."""
+        for label, factors in scaling.items():
+            plt.plot(thread_counts, factors, marker="o", label=label)
+        plt.plot(thread_counts, thread_counts, linestyle="--", label="Linear")
+        plt.xlabel("Threads")
+        plt.ylabel("Scaling vs. 1 Thread")
+        plt.title(f"Thread Scaling (GIL enabled: {gil_enabled()})")
+        plt.legend()
+        plt.show()
+
+
+class MainProgram:
+    """Measures how sorting throughput scales with the number of threads."""
+
+    def __init__(self, data_sizes, thread_counts=(1, 2, 4, 8), jobs_per_run=32):
+        self.data_sizes = data_sizes
+        self.thread_counts = list(thread_counts)
+        self.jobs_per_run = jobs_per_run
+        self.sorting_handler = SortingHandler()
+
+    def measure_throughput(self, algorithm, size):
+        """Return jobs per second for every thread count."""
+        jobs = [
+            (algorithm, generate_random_data(size)) for _ in range(self.jobs_per_run)
+        ]
+        return [
+            self.jobs_per_run
+            / TimeMeasurer.measure_time(
+                run_jobs, jobs, workers, self.sorting_handler, number=1
+            )
+            for workers in self.thread_counts
+        ]
+
+    def measure_parallel_merge_sort(self, size):
+        """Return the parallel merge sort time for every thread count."""
+        data = generate_random_data(size)
+        return [
+            TimeMeasurer.measure_time(
+                lambda workers: parallel_merge_sort(
+                    data[:], workers, sorting_handler=self.sorting_handler
+                ),
+                workers,
+                number=1,
+            )
+            for workers in self.thread_counts
+        ]
+
+    def run(self, show_results=True, return_results=False):
+        """Executes the scaling benchmark for the specified data sizes."""
+        throughput_rows, parallel_rows, scaling = [], [], {}
+        for size in self.data_sizes:
+            for algorithm in self.sorting_handler.algorithms:
+                throughputs = self.measure_throughput(algorithm, size)
+                factors = [rate / throughputs[0] for rate in throughputs]
+                scaling[f"{algorithm} jobs (n={size})"] = factors
+                throughput_rows.extend(
+                    [size, algorithm, workers, rate, factor]
+                    for workers, rate, factor in zip(
+                        self.thread_counts, throughputs, factors
+                    )
+                )
+            times = self.measure_parallel_merge_sort(size)
+            scaling[f"Parallel merge sort (n={size})"] = [times[0] / t for t in times]
+            parallel_rows.extend(
+                [size, workers, elapsed, times[0] / elapsed]
+                for workers, elapsed in zip(self.thread_counts, times)
+            )
+
+        if show_results:
+            ResultHandler.display_tables(throughput_rows, parallel_rows)
+            ResultHandler.plot_results(self.thread_counts, scaling)
+
+        if return_results:
+            return {
+                "gil_enabled": gil_enabled(),
+                "throughput": throughput_rows,
+                "parallel_merge_sort": parallel_rows,
+            }
+
+
+# Main execution block
+if __name__ == "__main__":
+    data_sizes = [100, 500, 1000]
+    program = MainProgram(data_sizes)
+    program.run()